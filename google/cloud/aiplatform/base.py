@@ -811,6 +811,14 @@ def optional_sync(
             if sync:
                 if self:
                     VertexAiResourceNounWithFutureManager.wait(self)
+                # also wait for input resources that are still being created
+                # or populated, ie: a Dataset whose import is running
+                for arg in bound_args.arguments.values():
+                    if isinstance(arg, FutureManager) and arg is not self:
+                        arg_future = arg._latest_future
+                        if arg_future:
+                            futures.wait([arg_future])
+                        arg._raise_future_exception()
                 return method(*args, **kwargs)
 
             # callbacks to call within the Future (in same Thread)
@@ -19,11 +19,12 @@
 import csv
 import logging
 from typing import List, Optional, Set
+from google.api_core import exceptions
 from google.auth import credentials as auth_credentials
 
 from google.cloud import bigquery
-from google.cloud import storage
 
+from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform import utils
 from google.cloud.aiplatform import datasets
 
@@ -123,15 +124,20 @@ class _ColumnNamesDataset(datasets._Dataset):
         gcs_bucket, gcs_blob = utils.extract_bucket_and_prefix_from_gcs_path(
             gcs_csv_file_path
         )
-        client = storage.Client(project=project, credentials=credentials)
+        client = initializer.global_config.get_storage_client(
+            project=project, credentials=credentials
+        )
         bucket = client.bucket(gcs_bucket)
         blob = bucket.blob(gcs_blob)
 
-        # Incrementally download the CSV file until the header is retrieved
+        # Incrementally download the CSV file until the header is retrieved,
+        # doubling the range each time to bound the number of round trips.
+        # Bytes are accumulated and decoded once so that multi-byte characters
+        # split across range boundaries are decoded correctly.
         first_new_line_index = -1
         start_index = 0
         increment = 1000
-        line = ""
+        data = b""
 
         try:
             logger = logging.getLogger("google.resumable_media._helpers")
@@ -139,14 +145,24 @@ class _ColumnNamesDataset(datasets._Dataset):
             logger.addFilter(logging_warning_filter)
 
             while first_new_line_index == -1:
-                line += blob.download_as_bytes(
-                    start=start_index, end=start_index + increment - 1
-                ).decode("utf-8")
+                try:
+                    chunk = blob.download_as_bytes(
+                        start=start_index, end=start_index + increment - 1
+                    )
+                except exceptions.RequestRangeNotSatisfiable:
+                    # The previous range ended exactly at the end of the file
+                    chunk = b""
+                data += chunk
+
+                first_new_line_index = data.find(b"\n", start_index)
+                if first_new_line_index == -1 and len(chunk) < increment:
+                    # Reached the end of the file, which is a header-only CSV
+                    first_new_line_index = len(data)
 
-                first_new_line_index = line.find("\n")
                 start_index += increment
+                increment *= 2
 
-            header_line = line[:first_new_line_index]
+            header_line = data[:first_new_line_index].decode("utf-8")
 
             # Split to make it an iterable
             header_line = header_line.split("\n")[:1]
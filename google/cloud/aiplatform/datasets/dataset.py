@@ -15,7 +15,23 @@
 # limitations under the License.
 #
 
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+from concurrent import futures
+import contextlib
+import functools
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from google.api_core import operation
 from google.auth import credentials as auth_credentials
@@ -35,6 +51,103 @@ from google.protobuf import field_mask_pb2
 
 _LOGGER = base.Logger(__name__)
 
+# Default number of dataset operations issued concurrently when a batch is flushed.
+_DEFAULT_BATCH_MAX_WORKERS = 8
+
+
+class _BatchContext:
+    """Collects dataset operations issued inside `_Dataset.batch()`.
+
+    Queued operations are executed concurrently when the batch is flushed,
+    except that operations on the same resource run one after another in the
+    order they were queued.
+    """
+
+    def __init__(
+        self,
+        dataset_class: Type["_Dataset"],
+        max_workers: int = _DEFAULT_BATCH_MAX_WORKERS,
+    ):
+        self._dataset_class = dataset_class
+        self._max_workers = max_workers
+        # Queued operations keyed by resource name, in queue order.
+        self._operations: Dict[str, List[Callable[[], Any]]] = {}
+
+    def _add(self, resource_name: str, operation_fn: Callable[[], Any]) -> None:
+        """Queues an operation to be executed when the batch is flushed.
+
+        Args:
+            resource_name (str):
+                Required. Fully-qualified name of the resource the operation
+                acts on.
+            operation_fn (Callable[[], Any]):
+                Required. A callable that issues the request and waits for it
+                to complete.
+        """
+        self._operations.setdefault(resource_name, []).append(operation_fn)
+
+    @staticmethod
+    def _run_in_order(operation_fns: Sequence[Callable[[], Any]]) -> None:
+        """Runs the operations queued for one resource, in queue order.
+
+        Operations after the first failure are not run.
+
+        Args:
+            operation_fns (Sequence[Callable[[], Any]]):
+                Required. The operations queued for the resource.
+        """
+        for operation_fn in operation_fns:
+            operation_fn()
+
+    def _flush(self) -> None:
+        """Executes all queued operations and waits for them.
+
+        Operations on different resources run concurrently. Operations on the
+        same resource run in the order they were queued.
+
+        Raises:
+            Exception: The first exception raised by a queued operation, after
+            all queued operations have completed.
+        """
+        operations, self._operations = self._operations, {}
+        if not operations:
+            return
+
+        with futures.ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(operations))
+        ) as executor:
+            submitted = [
+                executor.submit(self._run_in_order, operation_fns)
+                for operation_fns in operations.values()
+            ]
+
+        for future in submitted:
+            future.result()
+
+
+# Holds the active _BatchContexts of the current thread, innermost last.
+_batch_context = threading.local()
+
+
+def _get_current_batches() -> List[_BatchContext]:
+    """Returns the batches active on the current thread, innermost last."""
+    if not hasattr(_batch_context, "batches"):
+        _batch_context.batches = []
+    return _batch_context.batches
+
+
+def _get_current_batch(dataset: "_Dataset") -> Optional[_BatchContext]:
+    """Returns the innermost batch on the current thread that covers dataset.
+
+    Args:
+        dataset (_Dataset):
+            Required. The dataset an operation is issued on.
+    """
+    for batch in reversed(_get_current_batches()):
+        if isinstance(dataset, batch._dataset_class):
+            return batch
+    return None
+
 
 class _Dataset(base.VertexAiResourceNounWithFutureManager):
     """Managed dataset resource for Vertex AI."""
@@ -48,6 +161,14 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
     _format_resource_name_method = "dataset_path"
 
     _supported_metadata_schema_uris: Tuple[str] = ()
+    # Set form of _supported_metadata_schema_uris, built once per subclass
+    _supported_metadata_schema_uri_set: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._supported_metadata_schema_uri_set = frozenset(
+            cls._supported_metadata_schema_uris
+        )
 
     def __init__(
         self,
@@ -83,6 +204,43 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
         self._gca_resource = self._get_gca_resource(resource_name=dataset_name)
         self._validate_metadata_schema_uri()
 
+    @classmethod
+    def _instantiate_client(
+        cls,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        appended_user_agent: Optional[List[str]] = None,
+    ) -> utils.VertexAiServiceClientWithOverride:
+        """Helper method to instantiate service client for resource noun.
+
+        The client is shared with other datasets using the same location and
+        credentials, unless a user agent is appended.
+
+        Args:
+            location (str): The location of the resource noun.
+            credentials (google.auth.credentials.Credentials):
+                Optional custom credentials to use when accessing interacting with
+                resource noun.
+            appended_user_agent (List[str]):
+                Optional. User agent appended in the client info. If more than one,
+                it will be separated by spaces.
+        Returns:
+            client (utils.VertexAiServiceClientWithOverride):
+                Initialized service client for this service noun with optional overrides.
+        """
+        if appended_user_agent:
+            return super()._instantiate_client(
+                location=location,
+                credentials=credentials,
+                appended_user_agent=appended_user_agent,
+            )
+
+        return initializer.global_config.get_cached_client(
+            client_class=cls.client_class,
+            credentials=credentials,
+            location_override=location,
+        )
+
     @property
     def metadata_schema_uri(self) -> str:
         """The metadata schema uri of this dataset resource."""
@@ -96,14 +254,73 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
             ValueError: If the dataset type of the retrieved dataset resource is
             not supported by the class.
         """
-        if self._supported_metadata_schema_uris and (
-            self.metadata_schema_uri not in self._supported_metadata_schema_uris
+        if self._supported_metadata_schema_uri_set and (
+            self.metadata_schema_uri not in self._supported_metadata_schema_uri_set
         ):
             raise ValueError(
                 f"{self.__class__.__name__} class can not be used to retrieve "
                 f"dataset resource {self.resource_name}, check the dataset type"
             )
 
+    @classmethod
+    @contextlib.contextmanager
+    def batch(
+        cls, max_workers: int = _DEFAULT_BATCH_MAX_WORKERS
+    ) -> Iterator[_BatchContext]:
+        """Groups dataset deletions and imports so they are issued concurrently.
+
+        Calls to `delete` and `import_data` made with sync=True on the current
+        thread inside this context are queued instead of executed, for datasets
+        of this class and its subclasses only. When the context exits, the
+        queued operations are sent and the context blocks until they have
+        completed. Operations on different datasets are sent concurrently;
+        operations on the same dataset run one after another in the order
+        they were issued, and stop at the first one that fails. If the body
+        of the context raises, queued operations are discarded.
+
+        A batch nested in a batch that already covers this class joins the
+        enclosing batch, so its operations are sent when the enclosing batch
+        exits, with the enclosing batch's max_workers.
+
+        Example Usage:
+
+        with aiplatform.ImageDataset.batch():
+            for ds in aiplatform.ImageDataset.list(filter='labels.tmp="true"'):
+                ds.delete()
+
+        Args:
+            max_workers (int):
+                Optional. The maximum number of operations issued at once when
+                the batch is flushed. Defaults to 8. Ignored when this batch
+                joins an enclosing batch.
+
+        Yields:
+            batch (_BatchContext):
+                The batch collecting the queued operations.
+
+        Raises:
+            ValueError: If max_workers is not a positive integer.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer.")
+
+        batches = _get_current_batches()
+        # Nested batches are folded into an enclosing batch that already
+        # covers this class.
+        for current_batch in batches:
+            if issubclass(cls, current_batch._dataset_class):
+                yield current_batch
+                return
+
+        batch = _BatchContext(dataset_class=cls, max_workers=max_workers)
+        batches.append(batch)
+        try:
+            yield batch
+        finally:
+            batches.remove(batch)
+
+        batch._flush()
+
     @classmethod
     def create(
         cls,
@@ -224,6 +441,9 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
         if labels:
             utils.validate_labels(labels)
 
+        project = project or initializer.global_config.project
+        location = location or initializer.global_config.location
+
         api_client = cls._instantiate_client(location=location, credentials=credentials)
 
         datasource = _datasources.create_datasource(
@@ -242,8 +462,8 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
             display_name=display_name,
             metadata_schema_uri=metadata_schema_uri,
             datasource=datasource,
-            project=project or initializer.global_config.project,
-            location=location or initializer.global_config.location,
+            project=project,
+            location=location,
             credentials=credentials or initializer.global_config.credentials,
             request_metadata=request_metadata,
             labels=labels,
@@ -255,7 +475,52 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
         )
 
     @classmethod
-    @base.optional_sync()
+    def create_many(cls, specs: Sequence[Dict[str, Any]]) -> List["_Dataset"]:
+        """Creates multiple datasets concurrently.
+
+        Each dataset is created as if by calling `create(**spec, sync=False)`,
+        so the create and import long-running operations of all datasets are
+        polled concurrently instead of one dataset after another. This method
+        blocks until every dataset has been created.
+
+        Example Usage:
+
+        my_datasets = aiplatform.ImageDataset.create_many(
+            specs=[
+                {"display_name": "ds-a", "gcs_source": "gs://bucket/a.jsonl", ...},
+                {"display_name": "ds-b", "gcs_source": "gs://bucket/b.jsonl", ...},
+            ]
+        )
+
+        Args:
+            specs (Sequence[Dict[str, Any]]):
+                Required. Keyword arguments passed to `create` for each dataset.
+                A `sync` entry, if present, is ignored.
+
+        Returns:
+            datasets (List[Dataset]):
+                Instantiated representations of the managed dataset resources,
+                in the same order as specs.
+
+        Raises:
+            Exception: The first exception raised while creating a dataset, after
+            all dataset creations have completed.
+        """
+        dataset_objs = [cls.create(**{**spec, "sync": False}) for spec in specs]
+
+        exceptions = []
+        for dataset_obj in dataset_objs:
+            try:
+                dataset_obj.wait()
+            except Exception as e:
+                exceptions.append(e)
+
+        if exceptions:
+            raise exceptions[0]
+
+        return dataset_objs
+
+    @classmethod
     def _create_and_import(
         cls,
         api_client: dataset_service_client.DatasetServiceClient,
@@ -327,6 +592,10 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
                 Whether to execute this method synchronously. If False, this method
                 will be executed in concurrent Future and any downstream object will
                 be immediately returned and synced when the Future has completed.
+                The create and import steps run as separate chained Futures, so
+                the returned object is synced as soon as the dataset is created
+                while the import is still pending. Methods that take the dataset
+                as input wait for the import, whether or not they are synchronous.
             create_request_timeout (float):
                 Optional. The timeout for the create request in seconds.
             import_request_timeout (float):
@@ -337,6 +606,72 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
                 Instantiated representation of the managed dataset resource.
         """
 
+        dataset_obj = cls._create_dataset(
+            api_client=api_client,
+            parent=parent,
+            display_name=display_name,
+            metadata_schema_uri=metadata_schema_uri,
+            datasource=datasource,
+            project=project,
+            location=location,
+            credentials=credentials,
+            request_metadata=request_metadata,
+            labels=labels,
+            encryption_spec=encryption_spec,
+            sync=sync,
+            create_request_timeout=create_request_timeout,
+        )
+
+        # Import if import datasource is DatasourceImportable
+        if isinstance(datasource, _datasources.DatasourceImportable):
+            if sync:
+                dataset_obj._import_and_wait(
+                    datasource, import_request_timeout=import_request_timeout
+                )
+            else:
+
+                def import_and_wait():
+                    # The create Future may have already failed and been
+                    # cleared, leaving nothing to chain on; surface its error
+                    # instead of importing into a resource that does not exist.
+                    dataset_obj._raise_future_exception()
+                    dataset_obj._import_and_wait(
+                        datasource, import_request_timeout=import_request_timeout
+                    )
+
+                # Chained on the create Future, so dependents of dataset_obj
+                # still wait for the import to complete.
+                dataset_obj._submit(method=import_and_wait, args=[], kwargs={})
+
+        return dataset_obj
+
+    @classmethod
+    @base.optional_sync()
+    def _create_dataset(
+        cls,
+        api_client: dataset_service_client.DatasetServiceClient,
+        parent: str,
+        display_name: str,
+        metadata_schema_uri: str,
+        datasource: _datasources.Datasource,
+        project: str,
+        location: str,
+        credentials: Optional[auth_credentials.Credentials],
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        labels: Optional[Dict[str, str]] = None,
+        encryption_spec: Optional[gca_encryption_spec.EncryptionSpec] = None,
+        sync: bool = True,
+        create_request_timeout: Optional[float] = None,
+    ) -> "_Dataset":
+        """Creates a new dataset and waits for the create operation to complete.
+
+        Data is not imported; see _create_and_import for the arguments.
+
+        Returns:
+            dataset (Dataset):
+                Instantiated representation of the managed dataset resource.
+        """
+
         create_dataset_lro = cls._create(
             api_client=api_client,
             parent=parent,
@@ -355,21 +690,13 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
 
         _LOGGER.log_create_complete(cls, created_dataset, "ds")
 
-        dataset_obj = cls(
+        return cls(
             dataset_name=created_dataset.name,
             project=project,
             location=location,
             credentials=credentials,
         )
 
-        # Import if import datasource is DatasourceImportable
-        if isinstance(datasource, _datasources.DatasourceImportable):
-            dataset_obj._import_and_wait(
-                datasource, import_request_timeout=import_request_timeout
-            )
-
-        return dataset_obj
-
     def _import_and_wait(
         self,
         datasource,
@@ -556,11 +883,44 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
             data_item_labels=data_item_labels,
         )
 
+        batch = _get_current_batch(self)
+        if batch:
+            batch._add(
+                self.resource_name,
+                functools.partial(
+                    self._import_and_wait,
+                    datasource=datasource,
+                    import_request_timeout=import_request_timeout,
+                ),
+            )
+            return self
+
         self._import_and_wait(
             datasource=datasource, import_request_timeout=import_request_timeout
         )
         return self
 
+    def delete(self, sync: bool = True) -> None:
+        """Deletes this Vertex AI resource. WARNING: This deletion is
+        permanent.
+
+        If called with sync=True inside `batch()`, the deletion is queued and
+        issued when the batch exits.
+
+        Args:
+            sync (bool):
+                Whether to execute this deletion synchronously. If False, this method
+                will be executed in concurrent Future and any downstream object will
+                be immediately returned and synced when the Future has completed.
+        """
+        batch = _get_current_batch(self)
+        if batch and sync:
+            self.wait()
+            batch._add(self.resource_name, functools.partial(super().delete, sync=True))
+            return
+
+        super().delete(sync=sync)
+
     # TODO(b/174751568) add optional sync support
     def export_data(self, output_dir: str) -> Sequence[str]:
         """Exports data to output dir to GCS.
@@ -714,7 +1074,7 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
 
         dataset_subclass_filter = (
             lambda gapic_obj: gapic_obj.metadata_schema_uri
-            in cls._supported_metadata_schema_uris
+            in cls._supported_metadata_schema_uri_set
         )
 
         return cls._list_with_local_order(
@@ -121,6 +121,9 @@ class TabularDataset(datasets._ColumnNamesDataset):
         if labels:
             utils.validate_labels(labels)
 
+        project = project or initializer.global_config.project
+        location = location or initializer.global_config.location
+
         api_client = cls._instantiate_client(location=location, credentials=credentials)
 
         metadata_schema_uri = schema.dataset.metadata.tabular
@@ -139,8 +142,8 @@ class TabularDataset(datasets._ColumnNamesDataset):
             display_name=display_name,
             metadata_schema_uri=metadata_schema_uri,
             datasource=datasource,
-            project=project or initializer.global_config.project,
-            location=location or initializer.global_config.location,
+            project=project,
+            location=location,
             credentials=credentials or initializer.global_config.credentials,
             request_metadata=request_metadata,
             labels=labels,
@@ -234,8 +237,10 @@ class TabularDataset(datasets._ColumnNamesDataset):
                 % (len(df_source), _AUTOML_TRAINING_MIN_ROWS),
             )
 
+        project = project or initializer.global_config.project
+
         bigquery_client = bigquery.Client(
-            project=project or initializer.global_config.project,
+            project=project,
             credentials=credentials or initializer.global_config.credentials,
         )
 
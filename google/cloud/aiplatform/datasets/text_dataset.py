@@ -141,6 +141,9 @@ class TextDataset(datasets._Dataset):
         if labels:
             utils.validate_labels(labels)
 
+        project = project or initializer.global_config.project
+        location = location or initializer.global_config.location
+
         api_client = cls._instantiate_client(location=location, credentials=credentials)
 
         metadata_schema_uri = schema.dataset.metadata.text
@@ -160,8 +163,8 @@ class TextDataset(datasets._Dataset):
             display_name=display_name,
             metadata_schema_uri=metadata_schema_uri,
             datasource=datasource,
-            project=project or initializer.global_config.project,
-            location=location or initializer.global_config.location,
+            project=project,
+            location=location,
             credentials=credentials or initializer.global_config.credentials,
             request_metadata=request_metadata,
             labels=labels,
@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import re
-from typing import Optional
+from typing import Optional, Tuple
 import warnings
 
 from google.cloud.aiplatform import initializer
@@ -21,6 +22,96 @@ from google.cloud.aiplatform.constants import prediction
 from packaging import version
 
 
+_URI_MAP = prediction._SERVING_CONTAINER_URI_MAP
+_DOCS_URI_MESSAGE = (
+    f"See {prediction._SERVING_CONTAINER_DOCUMENTATION_URL} "
+    "for complete list of supported containers"
+)
+
+# Flattened _URI_MAP keyed by (region, framework, accelerator, framework_version)
+# so a supported combination is resolved with a single lookup.
+_SERVING_CONTAINER_URI_FLAT_MAP = {
+    (region, framework, accelerator, framework_version): uri
+    for region, frameworks in _URI_MAP.items()
+    for framework, accelerators in frameworks.items()
+    for accelerator, versions in accelerators.items()
+    for framework_version, uri in versions.items()
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _get_region_prefix(region: str) -> str:
+    """Returns the multi-region prefix of a region, e.g. "us" for "us-central1"."""
+    return region.split("-", 1)[0]
+
+
+@functools.lru_cache(maxsize=32)
+def _normalize_framework(framework: str) -> str:
+    """Returns the framework name as used in the container URI map."""
+    return framework.lower()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_available_versions(
+    region: str,
+    framework: str,
+    accelerator: str,
+) -> Tuple[version.Version, ...]:
+    """Returns the parsed framework versions that have pre-built containers.
+
+    Args:
+        region (str):
+            Required. Artifact Registry multi-region, e.g. `"us"`.
+        framework (str):
+            Required. Lowercase ML framework of the pre-built container.
+        accelerator (str):
+            Required. The type of accelerator support provided by container.
+    """
+    return tuple(
+        version.Version(available_version)
+        for available_version in _URI_MAP[region][framework][accelerator].keys()
+    )
+
+
+def _validate_container_region_framework_accelerator(
+    region: str,
+    framework: str,
+    accelerator: str,
+) -> None:
+    """Checks that pre-built containers exist for the region, framework and accelerator.
+
+    Args:
+        region (str):
+            Required. Artifact Registry multi-region, e.g. `"us"`.
+        framework (str):
+            Required. Lowercase ML framework of the pre-built container.
+        accelerator (str):
+            Required. The type of accelerator support provided by container.
+
+    Raises:
+        ValueError: If containers for provided framework are unavailable or the
+        container does not support the specified accelerator or region.
+    """
+    if not _URI_MAP.get(region):
+        raise ValueError(
+            f"Unsupported container region `{region}`, supported regions are "
+            f"{', '.join(_URI_MAP.keys())}. "
+            f"{_DOCS_URI_MESSAGE}"
+        )
+
+    if not _URI_MAP[region].get(framework):
+        raise ValueError(
+            f"No containers found for framework `{framework}`. Supported frameworks are "
+            f"{', '.join(_URI_MAP[region].keys())} {_DOCS_URI_MESSAGE}"
+        )
+
+    if not _URI_MAP[region][framework].get(accelerator):
+        raise ValueError(
+            f"{framework} containers do not support `{accelerator}` accelerator. Supported accelerators "
+            f"are {', '.join(_URI_MAP[region][framework].keys())}. {_DOCS_URI_MESSAGE}"
+        )
+
+
 def get_prebuilt_prediction_container_uri(
     framework: str,
     framework_version: str,
@@ -70,43 +161,60 @@ def get_prebuilt_prediction_container_uri(
         ValueError: If containers for provided framework are unavailable or the
         container does not support the specified version, accelerator, or region.
     """
-    URI_MAP = prediction._SERVING_CONTAINER_URI_MAP
-    DOCS_URI_MESSAGE = (
-        f"See {prediction._SERVING_CONTAINER_DOCUMENTATION_URL} "
-        "for complete list of supported containers"
+    # If region not provided, use initializer location. This is resolved before
+    # the cached lookup so that later aiplatform.init() calls are respected.
+    region = region or initializer.global_config.location
+
+    return _get_prebuilt_prediction_container_uri(
+        framework=framework,
+        framework_version=framework_version,
+        region=region,
+        accelerator=accelerator,
     )
 
-    # If region not provided, use initializer location
-    region = region or initializer.global_config.location
-    region = region.split("-", 1)[0]
-    framework = framework.lower()
 
-    if not URI_MAP.get(region):
-        raise ValueError(
-            f"Unsupported container region `{region}`, supported regions are "
-            f"{', '.join(URI_MAP.keys())}. "
-            f"{DOCS_URI_MESSAGE}"
-        )
+@functools.lru_cache(maxsize=256)
+def _get_prebuilt_prediction_container_uri(
+    framework: str,
+    framework_version: str,
+    region: str,
+    accelerator: str,
+) -> str:
+    """Cached implementation of get_prebuilt_prediction_container_uri.
 
-    if not URI_MAP[region].get(framework):
-        raise ValueError(
-            f"No containers found for framework `{framework}`. Supported frameworks are "
-            f"{', '.join(URI_MAP[region].keys())} {DOCS_URI_MESSAGE}"
-        )
+    Args:
+        framework (str):
+            Required. The ML framework of the pre-built container.
+        framework_version (str):
+            Required. The version of the specified ML framework as a string.
+        region (str):
+            Required. AI region or multi-region.
+        accelerator (str):
+            Required. The type of accelerator support provided by container.
 
-    if not URI_MAP[region][framework].get(accelerator):
-        raise ValueError(
-            f"{framework} containers do not support `{accelerator}` accelerator. Supported accelerators "
-            f"are {', '.join(URI_MAP[region][framework].keys())}. {DOCS_URI_MESSAGE}"
-        )
+    Returns:
+        uri (str):
+            A Vertex AI prediction container URI
+
+    Raises:
+        ValueError: If containers for provided framework are unavailable or the
+        container does not support the specified version, accelerator, or region.
+    """
+    region = _get_region_prefix(region)
+    framework = _normalize_framework(framework)
 
-    final_uri = URI_MAP[region][framework][accelerator].get(framework_version)
+    final_uri = _SERVING_CONTAINER_URI_FLAT_MAP.get(
+        (region, framework, accelerator, framework_version)
+    )
 
     if not final_uri:
+        _validate_container_region_framework_accelerator(
+            region=region, framework=framework, accelerator=accelerator
+        )
         raise ValueError(
             f"No serving container for `{framework}` version `{framework_version}` "
             f"with accelerator `{accelerator}` found. Supported versions "
-            f"include {', '.join(URI_MAP[region][framework][accelerator].keys())}. {DOCS_URI_MESSAGE}"
+            f"include {', '.join(_URI_MAP[region][framework][accelerator].keys())}. {_DOCS_URI_MESSAGE}"
         )
 
     return final_uri
@@ -160,41 +268,19 @@ def _get_closest_match_prebuilt_container_uri(
     Raises:
         ValueError: If the framework doesn't have suitable pre-built container.
     """
-    URI_MAP = prediction._SERVING_CONTAINER_URI_MAP
-    DOCS_URI_MESSAGE = (
-        f"See {prediction._SERVING_CONTAINER_DOCUMENTATION_URL} "
-        "for complete list of supported containers"
-    )
-
     # If region not provided, use initializer location
     region = region or initializer.global_config.location
-    region = region.split("-", 1)[0]
-    framework = framework.lower()
-
-    if not URI_MAP.get(region):
-        raise ValueError(
-            f"Unsupported container region `{region}`, supported regions are "
-            f"{', '.join(URI_MAP.keys())}. "
-            f"{DOCS_URI_MESSAGE}"
-        )
-
-    if not URI_MAP[region].get(framework):
-        raise ValueError(
-            f"No containers found for framework `{framework}`. Supported frameworks are "
-            f"{', '.join(URI_MAP[region].keys())} {DOCS_URI_MESSAGE}"
-        )
+    region = _get_region_prefix(region)
+    framework = _normalize_framework(framework)
 
-    if not URI_MAP[region][framework].get(accelerator):
-        raise ValueError(
-            f"{framework} containers do not support `{accelerator}` accelerator. Supported accelerators "
-            f"are {', '.join(URI_MAP[region][framework].keys())}. {DOCS_URI_MESSAGE}"
-        )
+    _validate_container_region_framework_accelerator(
+        region=region, framework=framework, accelerator=accelerator
+    )
 
     framework_version = version.Version(framework_version)
-    available_version_list = [
-        version.Version(available_version)
-        for available_version in URI_MAP[region][framework][accelerator].keys()
-    ]
+    available_version_list = _get_available_versions(
+        region=region, framework=framework, accelerator=accelerator
+    )
     try:
         closest_version = min(
             [
@@ -211,16 +297,16 @@ def _get_closest_match_prebuilt_container_uri(
             f"You are using `{framework}` version `{framework_version}`. "
             f"Vertex pre-built containers support up to `{framework}` version "
             f"`{max(available_version_list)}` and don't assume forward compatibility. "
-            f"Please build your own custom container. {DOCS_URI_MESSAGE}"
+            f"Please build your own custom container. {_DOCS_URI_MESSAGE}"
         ) from None
 
     if closest_version != framework_version:
         warnings.warn(
             f"No exact match for `{framework}` version `{framework_version}`. "
             f"Pre-built container for `{framework}` version `{closest_version}` is used. "
-            f"{DOCS_URI_MESSAGE}"
+            f"{_DOCS_URI_MESSAGE}"
         )
 
-    final_uri = URI_MAP[region][framework][accelerator].get(str(closest_version))
+    final_uri = _URI_MAP[region][framework][accelerator].get(str(closest_version))
 
     return final_uri
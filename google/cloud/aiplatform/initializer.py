@@ -17,16 +17,19 @@
 
 
 from concurrent import futures
+import functools
 import logging
 import pkg_resources
 import os
-from typing import List, Optional, Type, Union
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from google.api_core import client_options
 from google.api_core import gapic_v1
 import google.auth
 from google.auth import credentials as auth_credentials
 from google.auth.exceptions import GoogleAuthError
+from google.cloud import storage
 
 from google.cloud.aiplatform import compat
 from google.cloud.aiplatform.constants import base as constants
@@ -42,6 +45,25 @@ from google.cloud.aiplatform.compat.types import (
 )
 
 
+# Maximum number of clients kept by each of the _Config client caches.
+_CLIENT_CACHE_MAX_SIZE = 16
+
+
+@functools.lru_cache(maxsize=1)
+def _get_gapic_version() -> str:
+    """Returns the installed google-cloud-aiplatform version."""
+    return pkg_resources.get_distribution(
+        "google-cloud-aiplatform",
+    ).version
+
+
+def _put_in_bounded_cache(cache: Dict[Any, Any], key: Any, value: Any):
+    """Adds an entry to the cache, evicting the oldest entry when it is full."""
+    if key not in cache and len(cache) >= _CLIENT_CACHE_MAX_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
 class _Config:
     """Stores common parameters and options for API calls."""
 
@@ -50,8 +72,23 @@ class _Config:
         self._location = None
         self._staging_bucket = None
         self._credentials = None
+        # Application default credentials, resolved once on first use. Each
+        # google.auth.default() call returns a new object, and the client
+        # caches below are keyed on the credentials object.
+        self._default_credentials = None
         self._encryption_spec_key_name = None
         self._network = None
+        # Service clients shared between resource nouns, keyed by client class,
+        # location and the credentials they were requested with.
+        self._client_cache: Dict[
+            Tuple[Any, ...], utils.VertexAiServiceClientWithOverride
+        ] = {}
+        self._client_cache_lock = threading.Lock()
+        # Storage clients are shared across threads. google-cloud-storage
+        # does the same: transfer_manager hands one Client to all of its
+        # THREAD workers.
+        self._storage_client_cache = {}
+        self._storage_client_cache_lock = threading.Lock()
 
     def init(
         self,
@@ -252,12 +289,13 @@ class _Config:
         """Default credentials."""
         if self._credentials:
             return self._credentials
-        logger = logging.getLogger("google.auth._default")
-        logging_warning_filter = utils.LoggingFilter(logging.WARNING)
-        logger.addFilter(logging_warning_filter)
-        credentials, _ = google.auth.default()
-        logger.removeFilter(logging_warning_filter)
-        return credentials
+        if self._default_credentials is None:
+            logger = logging.getLogger("google.auth._default")
+            logging_warning_filter = utils.LoggingFilter(logging.WARNING)
+            logger.addFilter(logging_warning_filter)
+            self._default_credentials, _ = google.auth.default()
+            logger.removeFilter(logging_warning_filter)
+        return self._default_credentials
 
     @property
     def encryption_spec_key_name(self) -> Optional[str]:
@@ -364,9 +402,7 @@ class _Config:
         Returns:
             client: Instantiated Vertex AI Service client with optional overrides
         """
-        gapic_version = pkg_resources.get_distribution(
-            "google-cloud-aiplatform",
-        ).version
+        gapic_version = _get_gapic_version()
 
         user_agent = f"{constants.USER_AGENT_PRODUCT}/{gapic_version}"
         if appended_user_agent:
@@ -389,6 +425,73 @@ class _Config:
 
         return client_class(**kwargs)
 
+    def get_cached_client(
+        self,
+        client_class: Type[utils.VertexAiServiceClientWithOverride],
+        credentials: Optional[auth_credentials.Credentials] = None,
+        location_override: Optional[str] = None,
+    ) -> utils.VertexAiServiceClientWithOverride:
+        """Returns a shared VertexAiServiceClient, instantiating it on first use.
+
+        Clients are reused for the same client class, location and credentials
+        so their gRPC channels are not rebuilt on every call. Credentials are
+        keyed by identity, which is cheap to hash and never shares a client
+        between distinct credentials objects for the same account. Application
+        default credentials are resolved once, so callers that rely on them
+        share a client.
+
+        Args:
+            client_class (utils.VertexAiServiceClientWithOverride):
+                Required. A Vertex AI Service Client with optional overrides.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom auth credentials. If not provided will use the current config.
+            location_override (str): Optional. location override.
+        Returns:
+            client: Instantiated Vertex AI Service client with optional overrides
+        """
+        credentials = credentials or self.credentials
+        key = (client_class, location_override or self.location, credentials)
+        with self._client_cache_lock:
+            client = self._client_cache.get(key)
+        if client is not None:
+            return client
+
+        client = self.create_client(
+            client_class=client_class,
+            credentials=credentials,
+            location_override=location_override,
+        )
+        with self._client_cache_lock:
+            _put_in_bounded_cache(self._client_cache, key, client)
+        return client
+
+    def get_storage_client(
+        self,
+        project: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> storage.Client:
+        """Returns a shared Cloud Storage client, instantiating it on first use.
+
+        Args:
+            project (str): Optional. GCP project. If not provided will use the current project.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom auth credentials. If not provided will use the current config.
+        Returns:
+            client (storage.Client): Cloud Storage client.
+        """
+        project = project or self.project
+        credentials = credentials or self.credentials
+        key = (project, credentials)
+        with self._storage_client_cache_lock:
+            client = self._storage_client_cache.get(key)
+        if client is not None:
+            return client
+
+        client = storage.Client(project=project, credentials=credentials)
+        with self._storage_client_cache_lock:
+            _put_in_bounded_cache(self._storage_client_cache, key, client)
+        return client
+
 
 # global config to store init parameters: ie, aiplatform.init(project=..., location=...)
 global_config = _Config()
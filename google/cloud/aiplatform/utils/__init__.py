@@ -18,7 +18,7 @@
 
 import abc
 import datetime
-import pathlib
+import os
 import logging
 import re
 from typing import Any, Callable, Dict, Optional, Type, TypeVar, Tuple
@@ -695,7 +695,7 @@ def _timestamped_copy_to_gcs(
 
     gcs_bucket, gcs_blob_prefix = extract_bucket_and_prefix_from_gcs_path(gcs_dir)
 
-    local_file_name = pathlib.Path(local_file_path).name
+    local_file_name = os.path.basename(local_file_path)
     timestamp = datetime.datetime.now().isoformat(sep="-", timespec="milliseconds")
     blob_path = "-".join(["aiplatform", timestamp, local_file_name])
 
@@ -708,8 +708,7 @@ def _timestamped_copy_to_gcs(
     blob = bucket.blob(blob_path)
     blob.upload_from_filename(local_file_path)
 
-    gcs_path = "".join(["gs://", "/".join([blob.bucket.name, blob.name])])
-    return gcs_path
+    return f"gs://{gcs_bucket}/{blob_path}"
 
 
 def get_timestamp_proto(
@@ -18,23 +18,62 @@
 import datetime
 import glob
 import logging
+import os
 import pathlib
 from typing import Optional
 
 from google.auth import credentials as auth_credentials
 from google.cloud import storage
 
+try:
+    from google.cloud.storage import transfer_manager
+except ImportError:  # google-cloud-storage < 2.7.0
+    transfer_manager = None
+
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform.utils import resource_manager_utils
 
 _logger = logging.getLogger(__name__)
 
+# With concurrent_upload, files larger than this are uploaded as concurrent
+# chunks, when supported by the installed google-cloud-storage.
+_CONCURRENT_UPLOAD_THRESHOLD = 64 * 1024 * 1024
+
+
+def _upload_file_to_blob(
+    source_file_path: str,
+    destination_blob: storage.Blob,
+    concurrent_upload: bool = False,
+):
+    """Uploads a local file to a blob.
+
+    Args:
+        source_file_path: Required. Path of the local file to upload.
+        destination_blob: Required. Blob to upload the file to.
+        concurrent_upload: Optional. Whether to upload a large file in
+            concurrent chunks.
+    """
+    if (
+        concurrent_upload
+        and hasattr(transfer_manager, "upload_chunks_concurrently")
+        and os.path.getsize(source_file_path) > _CONCURRENT_UPLOAD_THRESHOLD
+    ):
+        # The library defaults use PROCESS workers, which google-cloud-storage
+        # recommends for large files.
+        transfer_manager.upload_chunks_concurrently(
+            filename=source_file_path,
+            blob=destination_blob,
+        )
+    else:
+        destination_blob.upload_from_filename(filename=source_file_path)
+
 
 def upload_to_gcs(
     source_path: str,
     destination_uri: str,
     project: Optional[str] = None,
     credentials: Optional[auth_credentials.Credentials] = None,
+    concurrent_upload: bool = False,
 ):
     """Uploads local files to GCS.
 
@@ -46,6 +85,14 @@ def upload_to_gcs(
         project: Optional. Google Cloud Project that contains the staging bucket.
         credentials: The custom credentials to use when making API calls.
             If not provided, default credentials will be used.
+        concurrent_upload: Optional. Whether to upload files larger than 64 MiB
+            in concurrent chunks with the google-cloud-storage transfer manager,
+            when the installed version supports it. Chunks are uploaded from
+            worker processes through the XML multipart upload API, which needs
+            the storage.multipartUploads permissions and does not support
+            object retention. An interrupted upload can leave incomplete parts
+            in the bucket until they are aborted, for example by an
+            AbortIncompleteMultipartUpload lifecycle rule.
 
     Raises:
         RuntimeError: When source_path does not exist.
@@ -55,10 +102,9 @@ def upload_to_gcs(
     if not source_path_obj.exists():
         raise RuntimeError(f"Source path does not exist: {source_path}")
 
-    project = project or initializer.global_config.project
-    credentials = credentials or initializer.global_config.credentials
-
-    storage_client = storage.Client(project=project, credentials=credentials)
+    storage_client = initializer.global_config.get_storage_client(
+        project=project, credentials=credentials
+    )
     if source_path_obj.is_dir():
         source_file_paths = glob.glob(
             pathname=str(source_path_obj / "**"), recursive=True
@@ -78,7 +124,7 @@ def upload_to_gcs(
             destination_blob = storage.Blob.from_string(
                 destination_file_uri, client=storage_client
             )
-            destination_blob.upload_from_filename(filename=source_file_path)
+            _upload_file_to_blob(source_file_path, destination_blob, concurrent_upload)
     else:
         source_file_path = source_path
         destination_file_uri = destination_uri
@@ -86,7 +132,7 @@ def upload_to_gcs(
         destination_blob = storage.Blob.from_string(
             destination_file_uri, client=storage_client
         )
-        destination_blob.upload_from_filename(filename=source_file_path)
+        _upload_file_to_blob(source_file_path, destination_blob, concurrent_upload)
 
 
 def stage_local_data_in_gcs(
@@ -284,10 +330,9 @@ def download_file_from_gcs(
         RuntimeError: When destination_path does not exist.
         GoogleCloudError: When the download process fails.
     """
-    project = project or initializer.global_config.project
-    credentials = credentials or initializer.global_config.credentials
-
-    storage_client = storage.Client(project=project, credentials=credentials)
+    storage_client = initializer.global_config.get_storage_client(
+        project=project, credentials=credentials
+    )
     source_blob = storage.Blob.from_string(source_file_uri, client=storage_client)
 
     _logger.debug(f'Downloading "{source_file_uri}" to "{destination_file_path}"')
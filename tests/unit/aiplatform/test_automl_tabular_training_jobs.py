@@ -15,8 +15,10 @@
 # limitations under the License.
 #
 
+from concurrent import futures
 import importlib
 import pytest
+import threading
 from unittest import mock
 
 from google.cloud import aiplatform
@@ -1008,6 +1010,45 @@ class TestAutoMLTabularTrainingJob:
                 sync=sync,
             )
 
+    @mock.patch.object(training_jobs, "_JOB_WAIT_TIME", 1)
+    @mock.patch.object(training_jobs, "_LOG_WAIT_TIME", 1)
+    @pytest.mark.usefixtures("mock_pipeline_service_get", "mock_model_service_get")
+    def test_run_with_sync_waits_for_dataset_import(
+        self, mock_pipeline_service_create, mock_dataset_tabular
+    ):
+        aiplatform.init(project=_TEST_PROJECT, staging_bucket=_TEST_BUCKET_NAME)
+
+        # the dataset was created with sync=False and its import is still running
+        import_future = futures.Future()
+        mock_dataset_tabular._latest_future = import_future
+        threading.Timer(0.5, import_future.set_result, args=[None]).start()
+
+        import_done_on_create = []
+
+        def create_training_pipeline(**kwargs):
+            import_done_on_create.append(import_future.done())
+            return mock.DEFAULT
+
+        mock_pipeline_service_create.side_effect = create_training_pipeline
+
+        job = training_jobs.AutoMLTabularTrainingJob(
+            display_name=_TEST_DISPLAY_NAME,
+            optimization_prediction_type=_TEST_TRAINING_OPTIMIZATION_PREDICTION_TYPE,
+            optimization_objective=_TEST_TRAINING_OPTIMIZATION_OBJECTIVE_NAME,
+            column_transformations=_TEST_TRAINING_COLUMN_TRANSFORMATIONS,
+            optimization_objective_recall_value=None,
+            optimization_objective_precision_value=None,
+        )
+
+        job.run(
+            dataset=mock_dataset_tabular,
+            target_column=_TEST_TRAINING_TARGET_COLUMN,
+            model_display_name=_TEST_MODEL_DISPLAY_NAME,
+            sync=True,
+        )
+
+        assert import_done_on_create == [True]
+
     @mock.patch.object(training_jobs, "_JOB_WAIT_TIME", 1)
     @mock.patch.object(training_jobs, "_LOG_WAIT_TIME", 1)
     @pytest.mark.parametrize("sync", [True, False])
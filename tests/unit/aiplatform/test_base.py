@@ -50,6 +50,10 @@ class _TestClass(base.FutureManager):
         time.sleep(1)
         return self._add(a=a, sync=sync)
 
+    @base.optional_sync()
+    def add_now(self, a: "_TestClass", sync=True) -> None:
+        return self._add(a=a, sync=sync)
+
     def _add(self, a: "_TestClass", sync=True) -> None:
         self.x = self.x + a.x
 
@@ -115,6 +119,18 @@ class TestFutureManager:
         assert isinstance(a, _TestClass)
         assert isinstance(b, _TestClass)
 
+    def test_sync_add_waits_for_async_created_argument(self):
+        b = _TestClass.create(7)
+        a = _TestClass.create(10, sync=False)
+
+        assert a._latest_future is not None
+
+        b.add_now(a, sync=True)
+
+        assert a._latest_future is None
+        assert a.x == 10
+        assert b.x == 17
+
     @pytest.mark.parametrize("sync", [True, False])
     def test_create_and_add_and_create_new_task(self, sync):
         _latest_future = None
@@ -19,11 +19,14 @@
 import pandas as pd
 
 import pytest
+import threading
+import time
 
 from unittest import mock
 from importlib import reload
 from unittest.mock import patch
 
+from google.api_core import exceptions
 from google.api_core import operation
 from google.auth import credentials as auth_credentials
 
@@ -589,6 +592,43 @@ class TestDataset:
             name=_TEST_NAME, retry=base._DEFAULT_RETRY
         )
 
+    def test_init_datasets_share_api_client(self, get_dataset_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_dataset = datasets._Dataset(dataset_name=_TEST_NAME)
+        other_dataset = datasets._Dataset(dataset_name=_TEST_NAME)
+        assert my_dataset.api_client is other_dataset.api_client
+
+    @pytest.mark.usefixtures("get_dataset_mock", "create_dataset_mock")
+    def test_datasets_share_api_client_with_default_credentials(self):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        # google.auth.default returns new credentials on every call
+        with patch(
+            "google.auth.default",
+            side_effect=lambda: (
+                auth_credentials.AnonymousCredentials(),
+                _TEST_PROJECT,
+            ),
+        ) as auth_default_mock, patch.object(
+            initializer.global_config,
+            "create_client",
+            wraps=initializer.global_config.create_client,
+        ) as create_client_mock:
+            my_datasets = [datasets._Dataset(dataset_name=_TEST_NAME) for _ in range(3)]
+            my_datasets.append(
+                datasets._Dataset.create(
+                    display_name=_TEST_DISPLAY_NAME,
+                    metadata_schema_uri=_TEST_METADATA_SCHEMA_URI_NONTABULAR,
+                )
+            )
+
+        create_client_mock.assert_called_once()
+        auth_default_mock.assert_called_once_with()
+        assert all(
+            my_dataset.api_client is my_datasets[0].api_client
+            for my_dataset in my_datasets
+        )
+
     def test_init_dataset_with_id_only_with_project_and_location(
         self, get_dataset_mock
     ):
@@ -864,6 +904,111 @@ class TestDataset:
         expected_dataset.name = _TEST_NAME
         assert my_dataset._gca_resource == expected_dataset
 
+    @pytest.mark.usefixtures("get_dataset_mock", "create_dataset_mock")
+    def test_create_and_import_dataset_syncs_before_import_completes(
+        self, import_data_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        import_done = threading.Event()
+        import_data_mock.return_value.result.side_effect = (
+            lambda timeout: import_done.wait(timeout=10)
+        )
+
+        my_dataset = datasets._Dataset.create(
+            display_name=_TEST_DISPLAY_NAME,
+            gcs_source=_TEST_SOURCE_URI_GCS,
+            metadata_schema_uri=_TEST_METADATA_SCHEMA_URI_NONTABULAR,
+            import_schema_uri=_TEST_IMPORT_SCHEMA_URI,
+            sync=False,
+        )
+
+        my_dataset._wait_for_resource_creation()
+
+        assert my_dataset.resource_name == _TEST_NAME
+        assert not my_dataset._are_futures_done()
+
+        import_done.set()
+        my_dataset.wait()
+
+        import_data_mock.assert_called_once()
+
+    def test_create_and_import_dataset_fails_with_create_error(
+        self, create_dataset_mock_fail, import_data_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        create_dataset_mock_fail.side_effect = exceptions.PermissionDenied("Mock fail")
+        submit = base.FutureManager._submit
+
+        def submit_after_futures_done(self, *args, **kwargs):
+            # Chain the import only once the create has already failed
+            while not self._are_futures_done():
+                time.sleep(0.01)
+            return submit(self, *args, **kwargs)
+
+        with patch.object(datasets._Dataset, "_submit", submit_after_futures_done):
+            my_dataset = datasets._Dataset.create(
+                display_name=_TEST_DISPLAY_NAME,
+                gcs_source=_TEST_SOURCE_URI_GCS,
+                metadata_schema_uri=_TEST_METADATA_SCHEMA_URI_NONTABULAR,
+                import_schema_uri=_TEST_IMPORT_SCHEMA_URI,
+                sync=False,
+            )
+
+        with pytest.raises(exceptions.PermissionDenied):
+            my_dataset.wait()
+
+        import_data_mock.assert_not_called()
+
+    @pytest.mark.usefixtures("get_dataset_mock")
+    def test_create_many_datasets(self, create_dataset_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_datasets = datasets._Dataset.create_many(
+            specs=[
+                {
+                    "display_name": _TEST_DISPLAY_NAME,
+                    "metadata_schema_uri": _TEST_METADATA_SCHEMA_URI_NONTABULAR,
+                    "encryption_spec_key_name": _TEST_ENCRYPTION_KEY_NAME,
+                    "sync": True,
+                }
+            ]
+            * 3
+        )
+
+        expected_dataset = gca_dataset.Dataset(
+            display_name=_TEST_DISPLAY_NAME,
+            metadata_schema_uri=_TEST_METADATA_SCHEMA_URI_NONTABULAR,
+            metadata=_TEST_NONTABULAR_DATASET_METADATA,
+            encryption_spec=_TEST_ENCRYPTION_SPEC,
+        )
+
+        assert create_dataset_mock.call_count == 3
+        create_dataset_mock.assert_called_with(
+            parent=_TEST_PARENT,
+            dataset=expected_dataset,
+            metadata=_TEST_REQUEST_METADATA,
+            timeout=None,
+        )
+        assert len(my_datasets) == 3
+        for my_dataset in my_datasets:
+            assert my_dataset.resource_name == _TEST_NAME
+
+    @pytest.mark.usefixtures("create_dataset_mock_fail")
+    def test_create_many_datasets_fail(self):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        with pytest.raises(RuntimeError):
+            datasets._Dataset.create_many(
+                specs=[
+                    {
+                        "display_name": _TEST_DISPLAY_NAME,
+                        "metadata_schema_uri": _TEST_METADATA_SCHEMA_URI_NONTABULAR,
+                    }
+                ]
+            )
+
     @pytest.mark.usefixtures("get_dataset_mock")
     @pytest.mark.parametrize("sync", [True, False])
     def test_import_data(self, import_data_mock, sync):
@@ -1041,6 +1186,124 @@ class TestDataset:
 
         delete_dataset_mock.assert_called_once_with(name=my_dataset.resource_name)
 
+    @pytest.mark.usefixtures("get_dataset_tabular_bq_mock")
+    def test_delete_datasets_in_batch(self, delete_dataset_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_datasets = [
+            datasets.TabularDataset(dataset_name=_TEST_NAME) for _ in range(3)
+        ]
+
+        with datasets.TabularDataset.batch():
+            for my_dataset in my_datasets:
+                my_dataset.delete()
+            delete_dataset_mock.assert_not_called()
+
+        assert delete_dataset_mock.call_count == 3
+        delete_dataset_mock.assert_called_with(name=_TEST_NAME)
+
+    @pytest.mark.usefixtures("get_dataset_tabular_bq_mock")
+    def test_delete_dataset_of_other_class_not_batched(self, delete_dataset_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_dataset = datasets.TabularDataset(dataset_name=_TEST_NAME)
+
+        with datasets.ImageDataset.batch():
+            my_dataset.delete()
+            delete_dataset_mock.assert_called_once_with(name=_TEST_NAME)
+
+            with datasets.TabularDataset.batch():
+                my_dataset.delete()
+                delete_dataset_mock.assert_called_once()
+
+            assert delete_dataset_mock.call_count == 2
+
+    @pytest.mark.usefixtures("get_dataset_mock")
+    def test_import_data_in_batch(self, import_data_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_dataset = datasets._Dataset(dataset_name=_TEST_NAME)
+
+        with datasets._Dataset.batch():
+            my_dataset.import_data(
+                gcs_source=_TEST_SOURCE_URI_GCS,
+                import_schema_uri=_TEST_IMPORT_SCHEMA_URI,
+                data_item_labels=_TEST_DATA_LABEL_ITEMS,
+            )
+            import_data_mock.assert_not_called()
+
+        expected_import_config = gca_dataset.ImportDataConfig(
+            gcs_source=gca_io.GcsSource(uris=[_TEST_SOURCE_URI_GCS]),
+            import_schema_uri=_TEST_IMPORT_SCHEMA_URI,
+            data_item_labels=_TEST_DATA_LABEL_ITEMS,
+        )
+
+        import_data_mock.assert_called_once_with(
+            name=_TEST_NAME,
+            import_configs=[expected_import_config],
+            timeout=None,
+        )
+
+    @pytest.mark.usefixtures("get_dataset_mock")
+    def test_batch_runs_operations_on_same_dataset_in_order(
+        self, import_data_mock, delete_dataset_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        # A slow import would let an unordered delete overtake it
+        import_data_mock.return_value.result.side_effect = lambda timeout: time.sleep(
+            0.1
+        )
+        call_order = mock.Mock()
+        call_order.attach_mock(import_data_mock, "import_data")
+        call_order.attach_mock(delete_dataset_mock, "delete_dataset")
+
+        my_dataset = datasets._Dataset(dataset_name=_TEST_NAME)
+
+        with datasets._Dataset.batch(max_workers=2):
+            my_dataset.import_data(
+                gcs_source=_TEST_SOURCE_URI_GCS,
+                import_schema_uri=_TEST_IMPORT_SCHEMA_URI,
+            )
+            my_dataset.delete()
+
+        assert [call[0] for call in call_order.mock_calls if "." not in call[0]] == [
+            "import_data",
+            "delete_dataset",
+        ]
+
+    @pytest.mark.usefixtures("get_dataset_mock")
+    def test_batch_skips_operations_on_dataset_after_failure(
+        self, import_data_mock, delete_dataset_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        import_data_mock.side_effect = RuntimeError("Mock fail")
+        my_dataset = datasets._Dataset(dataset_name=_TEST_NAME)
+
+        with pytest.raises(RuntimeError):
+            with datasets._Dataset.batch():
+                my_dataset.import_data(
+                    gcs_source=_TEST_SOURCE_URI_GCS,
+                    import_schema_uri=_TEST_IMPORT_SCHEMA_URI,
+                )
+                my_dataset.delete()
+
+        delete_dataset_mock.assert_not_called()
+
+    @pytest.mark.usefixtures("get_dataset_tabular_bq_mock")
+    def test_batch_discarded_on_exception(self, delete_dataset_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_dataset = datasets.TabularDataset(dataset_name=_TEST_NAME)
+
+        with pytest.raises(RuntimeError):
+            with datasets.TabularDataset.batch():
+                my_dataset.delete()
+                raise RuntimeError("Mock fail")
+
+        delete_dataset_mock.assert_not_called()
+
     @pytest.mark.usefixtures("get_dataset_mock")
     def test_update_dataset(self, update_dataset_mock):
         aiplatform.init(project=_TEST_PROJECT)
@@ -1311,6 +1574,12 @@ class TestTabularDataset:
         with pytest.raises(ValueError):
             datasets.TabularDataset(dataset_name=_TEST_NAME)
 
+    def test_supported_metadata_schema_uri_set(self):
+        assert datasets.TabularDataset._supported_metadata_schema_uri_set == frozenset(
+            datasets.TabularDataset._supported_metadata_schema_uris
+        )
+        assert datasets._Dataset._supported_metadata_schema_uri_set == frozenset()
+
     @pytest.mark.usefixtures("get_dataset_tabular_bq_mock")
     @pytest.mark.parametrize("sync", [True, False])
     def test_create_dataset_with_default_encryption_key(
@@ -1487,6 +1756,52 @@ class TestTabularDataset:
 
         assert set(my_dataset.column_names) == {"column_1", "column_2"}
 
+    @pytest.mark.usefixtures("get_dataset_tabular_gcs_mock")
+    def test_tabular_dataset_column_name_gcs_long_header(self):
+        # The multi-byte column name straddles the first range boundary
+        long_column = "c" * 998 + "é"
+        csv_data = f'{long_column},"column_2"\n0,1'.encode("utf-8")
+
+        with patch.object(storage.Blob, "download_as_bytes") as download_mock:
+            download_mock.side_effect = lambda start, end: csv_data[start : end + 1]
+            my_dataset = datasets.TabularDataset(dataset_name=_TEST_NAME)
+
+            assert set(my_dataset.column_names) == {long_column, "column_2"}
+            assert download_mock.call_args_list == [
+                mock.call(start=0, end=999),
+                mock.call(start=1000, end=2999),
+            ]
+
+    @pytest.mark.usefixtures("get_dataset_tabular_gcs_mock")
+    def test_tabular_dataset_column_name_gcs_header_only(self):
+        with patch.object(storage.Blob, "download_as_bytes") as download_mock:
+            download_mock.return_value = b'"column_1","column_2"'
+            my_dataset = datasets.TabularDataset(dataset_name=_TEST_NAME)
+
+            assert set(my_dataset.column_names) == {"column_1", "column_2"}
+            download_mock.assert_called_once_with(start=0, end=999)
+
+    @pytest.mark.usefixtures("get_dataset_tabular_gcs_mock")
+    def test_tabular_dataset_column_name_gcs_header_only_on_range_boundary(self):
+        # The header-only file ends exactly where the first range ends
+        column = "c" * 1000
+        csv_data = column.encode("utf-8")
+
+        def download_as_bytes(start, end):
+            if start >= len(csv_data):
+                raise exceptions.RequestRangeNotSatisfiable("Mock range error")
+            return csv_data[start : end + 1]
+
+        with patch.object(storage.Blob, "download_as_bytes") as download_mock:
+            download_mock.side_effect = download_as_bytes
+            my_dataset = datasets.TabularDataset(dataset_name=_TEST_NAME)
+
+            assert set(my_dataset.column_names) == {column}
+            assert download_mock.call_args_list == [
+                mock.call(start=0, end=999),
+                mock.call(start=1000, end=2999),
+            ]
+
     @pytest.mark.usefixtures("get_dataset_tabular_gcs_mock")
     def test_tabular_dataset_column_name_gcs_with_creds(self, gcs_client_mock):
         creds = auth_credentials.AnonymousCredentials()
@@ -23,6 +23,8 @@ from typing import Sequence
 from google.cloud import aiplatform
 from google.cloud.aiplatform import helpers
 from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform.constants import prediction
+from google.cloud.aiplatform.helpers import container_uri_builders
 
 
 class TestContainerUriHelpers:
@@ -82,6 +84,29 @@ class TestContainerUriHelpers:
 
         assert uri == expected_uri
 
+    def test_prediction_uri_flat_map_matches_uri_map(self):
+        uri_map = prediction._SERVING_CONTAINER_URI_MAP
+        flat_map = container_uri_builders._SERVING_CONTAINER_URI_FLAT_MAP
+
+        for (region, framework, accelerator, version), uri in flat_map.items():
+            assert uri_map[region][framework][accelerator][version] == uri
+            assert (
+                helpers.get_prebuilt_prediction_container_uri(
+                    framework=framework,
+                    framework_version=version,
+                    region=region,
+                    accelerator=accelerator,
+                )
+                == uri
+            )
+
+        assert len(flat_map) == sum(
+            len(versions)
+            for frameworks in uri_map.values()
+            for accelerators in frameworks.values()
+            for versions in accelerators.values()
+        )
+
     def test_correct_prediction_uri_args_with_init_location(self):
         """
         Ensure that aiplatform.init location is used when region
@@ -15,6 +15,7 @@
 # limitations under the License.
 #
 
+from concurrent import futures
 import importlib
 import os
 import pytest
@@ -24,6 +25,8 @@ from unittest.mock import patch
 import google.auth
 from google.auth import credentials
 
+from google.cloud import storage
+
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform.metadata.metadata import _experiment_tracker
 from google.cloud.aiplatform.constants import base as constants
@@ -259,6 +262,105 @@ class TestInit:
             assert " " + appended_user_agent[0] in user_agent
             assert " " + appended_user_agent[1] in user_agent
 
+    def test_get_cached_client_reuses_client(self):
+        initializer.global_config.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+        creds = credentials.AnonymousCredentials()
+        client = initializer.global_config.get_cached_client(
+            client_class=utils.ModelClientWithOverride, credentials=creds
+        )
+
+        assert isinstance(client, utils.ModelClientWithOverride)
+        assert client is initializer.global_config.get_cached_client(
+            client_class=utils.ModelClientWithOverride, credentials=creds
+        )
+        assert client is not initializer.global_config.get_cached_client(
+            client_class=utils.ModelClientWithOverride,
+            credentials=creds,
+            location_override=_TEST_LOCATION_2,
+        )
+        assert client is not initializer.global_config.get_cached_client(
+            client_class=utils.ModelClientWithOverride,
+            credentials=credentials.AnonymousCredentials(),
+        )
+
+    def test_get_cached_client_evicts_oldest_client(self):
+        initializer.global_config.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+        creds = [
+            credentials.AnonymousCredentials()
+            for _ in range(initializer._CLIENT_CACHE_MAX_SIZE + 1)
+        ]
+        for cred in creds:
+            initializer.global_config.get_cached_client(
+                client_class=utils.ModelClientWithOverride, credentials=cred
+            )
+
+        cache = initializer.global_config._client_cache
+        assert len(cache) == initializer._CLIENT_CACHE_MAX_SIZE
+        assert (
+            utils.ModelClientWithOverride,
+            _TEST_LOCATION,
+            creds[0],
+        ) not in cache
+
+    def test_create_client_looks_up_gapic_version_once(self):
+        initializer.global_config.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+        initializer._get_gapic_version.cache_clear()
+        with patch.object(
+            initializer.pkg_resources,
+            "get_distribution",
+            wraps=initializer.pkg_resources.get_distribution,
+        ) as get_distribution_mock:
+            for _ in range(2):
+                initializer.global_config.create_client(
+                    client_class=utils.ModelClientWithOverride
+                )
+
+        get_distribution_mock.assert_called_once_with("google-cloud-aiplatform")
+
+    def test_default_credentials_resolved_once(self):
+        initializer.global_config.init(project=_TEST_PROJECT)
+
+        # google.auth.default returns new credentials on every call
+        with patch.object(
+            google.auth,
+            "default",
+            side_effect=lambda: (credentials.AnonymousCredentials(), _TEST_PROJECT),
+        ) as auth_default_mock, patch.object(storage, "Client") as storage_client_mock:
+            client = initializer.global_config.get_storage_client()
+            assert client is initializer.global_config.get_storage_client(
+                credentials=initializer.global_config.credentials
+            )
+
+        storage_client_mock.assert_called_once_with(
+            project=_TEST_PROJECT, credentials=initializer.global_config.credentials
+        )
+        auth_default_mock.assert_called_once_with()
+
+    def test_get_storage_client_reuses_client(self):
+        initializer.global_config.init(project=_TEST_PROJECT)
+        creds = credentials.AnonymousCredentials()
+        with patch.object(storage, "Client") as storage_client_mock:
+            client = initializer.global_config.get_storage_client(credentials=creds)
+            assert client is initializer.global_config.get_storage_client(
+                credentials=creds
+            )
+            initializer.global_config.get_storage_client(
+                project=_TEST_PROJECT_2, credentials=creds
+            )
+
+            with futures.ThreadPoolExecutor(max_workers=1) as executor:
+                assert (
+                    client
+                    is executor.submit(
+                        initializer.global_config.get_storage_client, credentials=creds
+                    ).result()
+                )
+
+        assert storage_client_mock.call_args_list == [
+            mock.call(project=_TEST_PROJECT, credentials=creds),
+            mock.call(project=_TEST_PROJECT_2, credentials=creds),
+        ]
+
     @pytest.mark.parametrize(
         "init_location, location_override, expected_endpoint",
         [
@@ -36,6 +36,7 @@ from google.cloud import storage
 from google.cloud.aiplatform import compat, utils
 from google.cloud.aiplatform.compat.types import pipeline_failure_policy
 from google.cloud.aiplatform import datasets
+from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform.utils import (
     column_transformations_utils,
     gcs_utils,
@@ -534,10 +535,76 @@ class TestColumnTransformationsUtils:
 
 @pytest.mark.usefixtures("google_auth_mock")
 class TestGcsUtils:
+    def setup_method(self):
+        importlib.reload(initializer)
+        importlib.reload(aiplatform)
+
     def test_upload_to_gcs(self, json_file, mock_storage_blob_upload_from_filename):
         gcs_utils.upload_to_gcs(json_file, f"gs://{GCS_BUCKET}/{GCS_PREFIX}")
         assert mock_storage_blob_upload_from_filename.called_once_with(json_file)
 
+    @pytest.mark.skipif(
+        not hasattr(gcs_utils.transfer_manager, "upload_chunks_concurrently"),
+        reason="requires google-cloud-storage with transfer_manager.upload_chunks_concurrently",
+    )
+    def test_upload_to_gcs_concurrently_above_threshold(
+        self, json_file, mock_storage_blob_upload_from_filename
+    ):
+        with patch.object(gcs_utils, "_CONCURRENT_UPLOAD_THRESHOLD", 1), patch.object(
+            gcs_utils.transfer_manager, "upload_chunks_concurrently"
+        ) as mock_upload_chunks_concurrently:
+            gcs_utils.upload_to_gcs(
+                json_file, f"gs://{GCS_BUCKET}/{GCS_PREFIX}", concurrent_upload=True
+            )
+
+        mock_storage_blob_upload_from_filename.assert_not_called()
+        mock_upload_chunks_concurrently.assert_called_once()
+        call_kwargs = mock_upload_chunks_concurrently.call_args[1]
+        assert call_kwargs["filename"] == json_file
+        assert call_kwargs["blob"].name == GCS_PREFIX
+        # Uses the library's default PROCESS workers
+        assert "worker_type" not in call_kwargs
+
+    def test_upload_to_gcs_above_threshold_uploads_whole_file_by_default(
+        self, json_file, mock_storage_blob_upload_from_filename
+    ):
+        with patch.object(gcs_utils, "_CONCURRENT_UPLOAD_THRESHOLD", 1), patch.object(
+            gcs_utils, "transfer_manager"
+        ) as mock_transfer_manager:
+            gcs_utils.upload_to_gcs(json_file, f"gs://{GCS_BUCKET}/{GCS_PREFIX}")
+
+        mock_transfer_manager.upload_chunks_concurrently.assert_not_called()
+        mock_storage_blob_upload_from_filename.assert_called_once_with(
+            filename=json_file
+        )
+
+    def test_upload_to_gcs_below_threshold_uploads_whole_file(
+        self, json_file, mock_storage_blob_upload_from_filename
+    ):
+        with patch.object(gcs_utils, "transfer_manager") as mock_transfer_manager:
+            gcs_utils.upload_to_gcs(
+                json_file, f"gs://{GCS_BUCKET}/{GCS_PREFIX}", concurrent_upload=True
+            )
+
+        mock_transfer_manager.upload_chunks_concurrently.assert_not_called()
+        mock_storage_blob_upload_from_filename.assert_called_once_with(
+            filename=json_file
+        )
+
+    def test_upload_to_gcs_without_transfer_manager_uploads_whole_file(
+        self, json_file, mock_storage_blob_upload_from_filename
+    ):
+        with patch.object(gcs_utils, "_CONCURRENT_UPLOAD_THRESHOLD", 1), patch.object(
+            gcs_utils, "transfer_manager", None
+        ):
+            gcs_utils.upload_to_gcs(
+                json_file, f"gs://{GCS_BUCKET}/{GCS_PREFIX}", concurrent_upload=True
+            )
+
+        mock_storage_blob_upload_from_filename.assert_called_once_with(
+            filename=json_file
+        )
+
     def test_stage_local_data_in_gcs(
         self, json_file, mock_datetime, mock_storage_blob_upload_from_filename
     ):